@@ -1,18 +1,48 @@
 import tkinter as tk
+import tkinter.font
 from tkinter import ttk, filedialog, messagebox
 import os
 import re
 import shutil
+import subprocess
 import threading
+import bisect
+import heapq
+import time
+import itertools
 import difflib
 import logging
 import configparser
+import errno
 import json
+import sqlite3
 from pathlib import Path
-from typing import List, Dict, Tuple, Set, Optional
+from typing import Callable, List, Dict, Tuple, Set, Optional
 import importlib.util
 import sys
-import traceback
+from collections import deque
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+# Use rapidfuzz for similarity scoring if available, otherwise fall back to difflib
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
+# Use orjson for writing settings if available, otherwise fall back to json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Batched playlist scoring uses rapidfuzz's pairwise cpdist (rapidfuzz 3.6+), which also needs numpy
+try:
+    import numpy as np
+    from rapidfuzz.process import cpdist
+except ImportError:
+    np = None
+    cpdist = None
 
 # Version
 __version__ = "1.0.0"
@@ -26,14 +56,82 @@ logging.basicConfig(
 
 logger = logging.getLogger("MusicPlaylistManager")
 
+# Copy in 1 MiB chunks when the kernel copy paths aren't available (the default is 64 KiB)
+if hasattr(shutil, "COPY_BUFSIZE"):
+    shutil.COPY_BUFSIZE = 1024 * 1024
+
+# Music file extensions offered in the UI and enabled by default
+_DEFAULT_EXTENSIONS = ("mp3", "m4a", "flac", "ogg", "aac", "wav")
+
+# Filename parsing patterns
+_TRACK_RE = re.compile(r'^(\d+)[\s_-]*')
+
+# Artist/song separators in order of preference ("Artist - Song", "Artist_-_Song", "Artist_Song")
+_FILENAME_SEPARATORS = ("-", "_-_", "_")
+
+# Characters that separate query words; ASCII text uses an equivalent translate table
+_NONWORD_RE = re.compile(r'[^\w\s]')
+_ASCII_NONWORD_TABLE = str.maketrans({c: ' ' for c in map(chr, range(128)) if _NONWORD_RE.match(c)})
+
+# Minimum playlist entries x music files before matching is spread across processes
+_PARALLEL_MATCH_MIN_WORK = 200000
+
+# Rows added to the playlist match preview table at a time
+_PREVIEW_ROW_CHUNK = 200
+
+# Files copied in parallel when exporting playlist matches (fewer on small machines)
+_COPY_WORKERS = min(8, (os.cpu_count() or 4) * 2)
+
+# Seconds to wait after a settings change before writing the config file
+_SETTINGS_SAVE_DELAY = 0.5
+
+# Seconds between scan progress reports
+_SCAN_PROGRESS_INTERVAL = 0.25
+
+# Seconds between Info column updates while metadata is read in the background
+_METADATA_UPDATE_INTERVAL = 0.1
+
+# Errors meaning a kernel copy call can't be used for this pair of files, so the next method is tried
+_COPY_FALLBACK_ERRNOS = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSOCK, errno.EBADF,
+})
+
+# Milliseconds between threshold label updates while a slider is dragged
+_THRESHOLD_LABEL_DELAY = 50
+
+# Maximum (playlist entry, candidate file) pairs scored per cpdist call (bounds memory)
+_CPDIST_BLOCK_PAIRS = 1000000
+
+# Schema version of the scan cache; bump when parsing changes to discard old entries
+_SCAN_CACHE_VERSION = 1
+
+def _prepare_query(query: str) -> Tuple[str, List[str]]:
+    """Lowercase and tokenize a query once so it can be matched against many files"""
+    query_lower = query.lower()
+    if query_lower.isascii():
+        return query_lower, query_lower.translate(_ASCII_NONWORD_TABLE).split()
+    return query_lower, _NONWORD_RE.sub(' ', query_lower).split()
+
+def _similarity(a: str, b: str) -> float:
+    """Return the similarity ratio (0.0 to 1.0) between two strings"""
+    if fuzz is not None:
+        return fuzz.ratio(a, b) / 100.0
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
 class MusicFile:
     """Represents a music file with metadata and matching capabilities"""
     
-    def __init__(self, full_path: str):
+    # Libraries hold tens of thousands of these, so skip the per-instance __dict__
+    __slots__ = (
+        "full_path", "filename", "extension", "size", "artist", "song", "track_num", "_metadata",
+        "_text_lower", "_artist_song_lower", "_song_artist_lower"
+    )
+    
+    def __init__(self, full_path: str, size: Optional[int] = None):
         self.full_path = full_path
         self.filename = os.path.basename(full_path)
         self.extension = os.path.splitext(full_path)[1].lower()[1:]  # Remove the dot
-        self.size = os.path.getsize(full_path)
+        self.size = size if size is not None else os.path.getsize(full_path)
         self.artist = ""
         self.song = ""
         self.track_num = None
@@ -41,8 +139,50 @@ class MusicFile:
         # Parse the filename to extract artist and song
         self._parse_filename()
         
-        # Get additional metadata if possible
-        self.metadata = self._extract_metadata()
+        # Tags are only read up front when the filename lacks the artist or song;
+        # otherwise length and quality are read on first access to metadata
+        self._metadata = None
+        if not (self.artist and self.song):
+            self._metadata = self._extract_metadata()
+        
+        # Metadata may have filled in artist/song
+        self._cache_match_text()
+    
+    @classmethod
+    def from_direntry(cls, entry: os.DirEntry) -> "MusicFile":
+        """Create a MusicFile from a scandir entry, reusing its cached stat"""
+        return cls(entry.path, entry.stat().st_size)
+    
+    @classmethod
+    def from_cache(cls, full_path: str, size: int, artist: str, song: str,
+                   track_num: Optional[int], metadata: Optional[Dict]) -> "MusicFile":
+        """Recreate a MusicFile from previously parsed values without reading the file"""
+        music_file = cls.__new__(cls)
+        music_file.full_path = full_path
+        music_file.filename = os.path.basename(full_path)
+        music_file.extension = os.path.splitext(full_path)[1].lower()[1:]
+        music_file.size = size
+        music_file.artist = artist
+        music_file.song = song
+        music_file.track_num = track_num
+        music_file._metadata = metadata
+        music_file._cache_match_text()
+        return music_file
+    
+    def _cache_match_text(self):
+        """Cache the lowercased text used for matching"""
+        artist_lower = self.artist.lower()
+        song_lower = self.song.lower()
+        self._text_lower = f"{self.filename.lower()} {artist_lower} {song_lower}"
+        self._artist_song_lower = f"{artist_lower} - {song_lower}"
+        self._song_artist_lower = f"{song_lower} - {artist_lower}"
+    
+    @property
+    def metadata(self) -> Dict:
+        """Length and quality metadata, extracted from the file on first access"""
+        if self._metadata is None:
+            self._metadata = self._extract_metadata()
+        return self._metadata
     
     def _parse_filename(self):
         """Parse filename to extract artist, song, and track number"""
@@ -50,50 +190,27 @@ class MusicFile:
         name_without_ext = os.path.splitext(self.filename)[0]
         
         # Try to extract track number if present
-        track_pattern = r'^(\d+)[\s_-]*'
-        track_match = re.match(track_pattern, name_without_ext)
+        track_match = _TRACK_RE.match(name_without_ext)
         if track_match:
             self.track_num = int(track_match.group(1))
             # Remove track number from the name
-            name_without_ext = re.sub(track_pattern, '', name_without_ext)
-        
-        # Try different filename patterns for "Artist - Song" format
-        artist_first_patterns = [
-            # "Artist - Song"
-            r'^(.*?)\s*-\s*(.*?)$',
-            # "Artist_-_Song"
-            r'^(.*?)_-_(.*?)$',
-            # "Artist_Song"
-            r'^(.*?)_(.*?)$'
-        ]
-        
-        # Try different filename patterns for "Song - Artist" format
-        song_first_patterns = [
-            # "Song - Artist"
-            r'^(.*?)\s*-\s*(.*?)$',
-            # "Song_-_Artist"
-            r'^(.*?)_-_(.*?)$',
-            # "Song_Artist"
-            r'^(.*?)_(.*?)$'
-        ]
-        
-        # Try artist first patterns
-        for pattern in artist_first_patterns:
-            match = re.match(pattern, name_without_ext)
-            if match:
-                self.artist = match.group(1).strip()
-                self.song = match.group(2).strip()
+            name_without_ext = name_without_ext[track_match.end():]
+        
+        # Split on the first separator, trying "Artist - Song", "Artist_-_Song"
+        # and "Artist_Song" in that order
+        last_split = None
+        for separator in _FILENAME_SEPARATORS:
+            first, found, second = name_without_ext.partition(separator)
+            if found:
+                last_split = (first.strip(), second.strip())
+                self.artist, self.song = last_split
                 if self.artist and self.song:  # If both parts are non-empty
                     return
         
-        # If artist first patterns didn't work, try song first patterns
-        for pattern in song_first_patterns:
-            match = re.match(pattern, name_without_ext)
-            if match:
-                self.song = match.group(1).strip()
-                self.artist = match.group(2).strip()
-                if self.artist and self.song:  # If both parts are non-empty
-                    return
+        # "Song - Artist" uses the same separators, so a partial split is
+        # kept in song-first order from the last separator found
+        if last_split:
+            self.song, self.artist = last_split
         
         # If no pattern matched, use the whole filename as the song name
         if not self.artist and not self.song:
@@ -139,12 +256,12 @@ class MusicFile:
     
     def match_query(self, query: str, threshold: float = 0.6) -> float:
         """Match this file against a search query, return similarity score"""
-        query = query.lower()
-        query_parts = set(re.sub(r'[^\w\s]', ' ', query).split())
-        
+        return self.match_prepared(*_prepare_query(query), threshold)
+    
+    def match_prepared(self, query: str, query_parts: List[str], threshold: float = 0.6) -> float:
+        """Match this file against a query already prepared with _prepare_query"""
         # Text to match against (filename, artist, song)
-        text = f"{self.filename.lower()} {self.artist.lower()} {self.song.lower()}"
-        text_parts = set(re.sub(r'[^\w\s]', ' ', text).split())
+        text = self._text_lower
         
         # Check if all query parts are in the text
         if not query_parts or not all(part in text for part in query_parts):
@@ -154,31 +271,181 @@ class MusicFile:
         if threshold <= 0.5:
             return 1.0
         
-        # For higher thresholds, use fuzzy matching
-        # Try to match against the full query first
-        full_match_score = difflib.SequenceMatcher(None, query, text).ratio()
+        # For higher thresholds, apply the shared scoring rules with fuzzy matching
+        return _final_score(query, self, text, lambda floor: self._fuzzy_score(query, threshold, floor))
+    
+    def _fuzzy_score(self, query: str, threshold: float, floor: float) -> float:
+        """Best fuzzy score of the query against this file's match texts, or floor if none beats it"""
+        best_score = floor
+        
+        # Match against the text, artist + song and reversed song + artist combinations
+        for candidate in (self._text_lower, self._artist_song_lower, self._song_artist_lower):
+            # The ratio can never exceed 2 * min(len) / sum(len), so skip the
+            # matcher when the length difference alone rules the candidate out
+            length_bound = 2.0 * min(len(query), len(candidate)) / (len(query) + len(candidate))
+            if length_bound < threshold or length_bound <= best_score:
+                continue
+            best_score = max(best_score, _similarity(query, candidate))
         
-        # Then try to match artist + song combination
-        artist_song = f"{self.artist.lower()} - {self.song.lower()}"
-        artist_song_score = difflib.SequenceMatcher(None, query, artist_song).ratio()
+        # Return the best match score
+        return best_score
+
+def _final_score(query: str, music_file: MusicFile, text: str, fuzzy: Callable[[float], float]) -> float:
+    """
+    Score a candidate that passed the word gate, using the rules shared by every matcher
+    
+    Exact "Artist - Song" lines (e.g. from a Spotify export) score 1.0 without fuzzy
+    matching. A substring hit scores at least max(0.9, len(query) / len(text)); fuzzy
+    is called with that floor and returns the best fuzzy score, so it can skip
+    matches that can't beat it.
+    """
+    if query == music_file._artist_song_lower or query == music_file._song_artist_lower:
+        return 1.0
+    
+    floor = max(0.9, len(query) / len(text)) if query in text else 0.0
+    return max(floor, fuzzy(floor))
+
+def _load_music_file(entry: os.DirEntry, cached: Optional[tuple] = None) -> Optional[Tuple[MusicFile, float]]:
+    """Create a MusicFile for a scanned entry and return it with its mtime, or None if it can't be read.
+    
+    The cached row from the last scan is reused when the file's mtime and size are unchanged.
+    """
+    try:
+        stat = entry.stat()
+        if cached is not None and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+            _, size, artist, song, track_num, length, quality = cached
+            metadata = {"length": length, "quality": quality} if length is not None else None
+            return MusicFile.from_cache(entry.path, size, artist, song, track_num, metadata), stat.st_mtime
+        return MusicFile.from_direntry(entry), stat.st_mtime
+    except Exception as e:
+        logger.error(f"Error processing file {entry.path}: {str(e)}")
+        return None
+
+class MusicTextIndex:
+    """Lowercased match text of a list of music files, joined for fast word lookups"""
+    
+    def __init__(self, music_files: List[MusicFile]):
+        self.music_files = music_files
+        self.texts = [music_file._text_lower for music_file in music_files]
+        # Texts are separated by NUL, which query words never contain
+        self.blob = "\0".join(self.texts)
+        # Start offset of each text in the blob, plus one past the end
+        self.starts = list(itertools.accumulate((len(text) + 1 for text in self.texts), initial=0))
+    
+    def candidates(self, query_parts: List[str]) -> List[int]:
+        """Return the indices of files whose text contains every query word, in file order"""
+        if not query_parts:
+            return []
         
-        # Try reversed song + artist combination
-        song_artist = f"{self.song.lower()} - {self.artist.lower()}"
-        song_artist_score = difflib.SequenceMatcher(None, query, song_artist).ratio()
+        # Find the files containing the longest (usually rarest) word by searching
+        # the joined text, then check the other words on those files only
+        longest = max(query_parts, key=len)
+        find = self.blob.find
+        starts = self.starts
+        texts = self.texts
+        found = []
+        position = find(longest)
+        while position != -1:
+            index = bisect.bisect_right(starts, position) - 1
+            if all(part in texts[index] for part in query_parts):
+                found.append(index)
+            # Further hits in the same file add nothing, so skip to the next one
+            position = find(longest, starts[index + 1])
+        return found
+
+def _match_entry(text_index: MusicTextIndex, entry: str, threshold: float) -> List[Tuple[int, float]]:
+    """Return (index, score) pairs for the music files matching a playlist entry"""
+    entry_lower, entry_parts = _prepare_query(entry)
+    music_files = text_index.music_files
+    matches = []
+    for index in text_index.candidates(entry_parts):
+        score = music_files[index].match_prepared(entry_lower, entry_parts, threshold)
+        if score >= threshold:
+            matches.append((index, score))
+    return matches
+
+def _match_entries_cpdist(text_index: MusicTextIndex, entries: List[str], threshold: float) -> List[List[Tuple[int, float]]]:
+    """
+    Match playlist entries using rapidfuzz's batched pairwise scorer
+    
+    Produces the same (index, score) pairs as _match_entry for thresholds above 0.5.
+    Each entry is only scored against the candidates that contain all of its words,
+    but the fuzzy scores of many (entry, candidate) pairs are computed per native call.
+    """
+    music_files = text_index.music_files
+    texts = text_index.texts
+    choice_lists = (
+        texts,
+        [music_file._artist_song_lower for music_file in music_files],
+        [music_file._song_artist_lower for music_file in music_files]
+    )
+    
+    all_matches = []
+    
+    def score_block(block):
+        """Score a block of (query, candidate indices) and append their matches"""
+        pair_queries = [query for query, candidates in block for _ in candidates]
+        pair_indices = [index for _, candidates in block for index in candidates]
+        
+        # Best fuzzy score of each pair against the file's three candidate texts
+        scores = None
+        for choices in choice_lists:
+            pair_scores = cpdist(
+                pair_queries, [choices[index] for index in pair_indices], scorer=fuzz.ratio,
+                score_cutoff=threshold * 100, dtype=np.float64, workers=-1
+            )
+            scores = pair_scores if scores is None else np.maximum(scores, pair_scores, out=scores)
         
-        # Return the best match score
-        return max(full_match_score, artist_song_score, song_artist_score)
+        position = 0
+        for query, candidates in block:
+            matches = []
+            for index, fuzzy_score in zip(candidates, scores[position:position + len(candidates)].tolist()):
+                score = _final_score(query, music_files[index], texts[index], lambda floor: fuzzy_score / 100.0)
+                if score >= threshold:
+                    matches.append((index, score))
+            all_matches.append(matches)
+            position += len(candidates)
+    
+    block = []
+    block_pairs = 0
+    for entry in entries:
+        query, query_parts = _prepare_query(entry)
+        candidates = text_index.candidates(query_parts)
+        block.append((query, candidates))
+        block_pairs += len(candidates)
+        if block_pairs >= _CPDIST_BLOCK_PAIRS:
+            score_block(block)
+            block = []
+            block_pairs = 0
+    if block:
+        score_block(block)
+    
+    return all_matches
+
+# Text index shared with each matching worker process (set by _init_match_worker)
+_worker_text_index: Optional[MusicTextIndex] = None
+
+def _init_match_worker(music_files: List[MusicFile]):
+    """Receive the music file list once per worker process and index it"""
+    global _worker_text_index
+    _worker_text_index = MusicTextIndex(music_files)
+
+def _match_entry_in_worker(entry: str, threshold: float) -> List[Tuple[int, float]]:
+    """Match a playlist entry against the worker's copy of the music files"""
+    return _match_entry(_worker_text_index, entry, threshold)
 
 class MusicDatabase:
     """Manages scanning and searching music files"""
     
-    def __init__(self):
+    def __init__(self, cache_file: Optional[str] = None):
         self.music_files: List[MusicFile] = []
         self.directories: List[str] = []
-        self.file_extensions: Set[str] = {"mp3", "m4a", "flac", "ogg", "aac", "wav"}
+        self.file_extensions: Set[str] = set(_DEFAULT_EXTENSIONS)
         self.is_scanning = False
         self.scan_thread = None
         self.scan_progress_callback = None
+        self._text_index: Optional[MusicTextIndex] = None
+        self.cache_file = cache_file
     
     def add_directory(self, directory: str) -> bool:
         """Add a directory to the list of directories to scan"""
@@ -216,58 +483,95 @@ class MusicDatabase:
         
         return True
     
+    def _iter_music_entries(self, directory: str):
+        """Yield a DirEntry for every music file under a directory, in a single pass"""
+        pending = [directory]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                # Unreadable directories are skipped, as os.walk would
+                continue
+            
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+                ext = os.path.splitext(entry.name)[1].lower()[1:]  # Remove the dot
+                if ext in self.file_extensions:
+                    yield entry
+            
+            # Visit subdirectories in listing order, after this directory's files
+            pending.extend(reversed(subdirs))
+    
     def _scan_worker(self):
         """Worker thread for scanning directories"""
         try:
-            total_files = 0
             processed_files = 0
+            last_report = time.monotonic()
             
-            # First count total files to scan
-            for directory in self.directories:
-                for root, _, files in os.walk(directory):
-                    for file in files:
-                        ext = os.path.splitext(file)[1].lower()[1:]  # Remove the dot
-                        if ext in self.file_extensions:
-                            total_files += 1
+            # Parse results from the last scan, keyed by path
+            scan_cache = self._load_scan_cache()
+            scanned = []
+            
+            def collect(future):
+                """Store a finished MusicFile and report progress"""
+                nonlocal processed_files, last_report
+                result = future.result()
+                if result is not None:
+                    self.music_files.append(result[0])
+                    scanned.append(result)
+                
+                processed_files += 1
+                now = time.monotonic()
+                if self.scan_progress_callback and now - last_report >= _SCAN_PROGRESS_INTERVAL:
+                    last_report = now
+                    self.scan_progress_callback(
+                        processed_files, 0, f"Scanned {processed_files} files..."
+                    )
             
             # Report initial progress
             if self.scan_progress_callback:
-                self.scan_progress_callback(0, total_files, "Starting scan...")
+                self.scan_progress_callback(0, 0, "Starting scan...")
             
-            # Then scan and process files
-            for directory in self.directories:
-                for root, _, files in os.walk(directory):
-                    for file in files:
+            # Walk the directories in one pass while a thread pool reads the files,
+            # so file I/O overlaps; results are collected in walk order
+            max_workers = min(32, (os.cpu_count() or 4) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = deque()
+                for directory in self.directories:
+                    for entry in self._iter_music_entries(directory):
                         if not self.is_scanning:
                             # Scanning was cancelled
                             if self.scan_progress_callback:
-                                self.scan_progress_callback(
-                                    processed_files, total_files, "Scan cancelled."
-                                )
+                                self.scan_progress_callback(processed_files, 0, "Scan cancelled.")
                             return
                         
-                        ext = os.path.splitext(file)[1].lower()[1:]  # Remove the dot
-                        if ext in self.file_extensions:
-                            full_path = os.path.join(root, file)
-                            try:
-                                music_file = MusicFile(full_path)
-                                self.music_files.append(music_file)
-                            except Exception as e:
-                                logger.error(f"Error processing file {full_path}: {str(e)}")
-                            
-                            processed_files += 1
-                            if self.scan_progress_callback and total_files > 0:
-                                progress = (processed_files / total_files) * 100
-                                self.scan_progress_callback(
-                                    processed_files, 
-                                    total_files,
-                                    f"Scanned {processed_files} of {total_files} files ({progress:.1f}%)"
-                                )
+                        pending.append(executor.submit(_load_music_file, entry, scan_cache.get(entry.path)))
+                        
+                        # Keep a bounded number of files in flight
+                        if len(pending) >= max_workers * 4:
+                            collect(pending.popleft())
+                
+                while pending:
+                    collect(pending.popleft())
             
             if self.scan_progress_callback:
                 self.scan_progress_callback(
-                    total_files, total_files, f"Scan complete. Found {len(self.music_files)} music files."
+                    processed_files, processed_files, f"Scan complete. Found {len(self.music_files)} music files."
                 )
+            
+            # Rewrite the cache only if files were added, changed or removed since the last scan
+            if len(scanned) != len(scan_cache) or any(
+                scan_cache.get(music_file.full_path, (None, None))[:2] != (mtime, music_file.size)
+                for music_file, mtime in scanned
+            ):
+                self._save_scan_cache(scanned)
         except Exception as e:
             logger.error(f"Error during scan: {str(e)}")
             if self.scan_progress_callback:
@@ -275,12 +579,88 @@ class MusicDatabase:
         finally:
             self.is_scanning = False
     
+    def _load_scan_cache(self) -> Dict[str, tuple]:
+        """Load the parse results saved by the last scan"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        
+        try:
+            with closing(sqlite3.connect(self.cache_file)) as conn:
+                if conn.execute("PRAGMA user_version").fetchone()[0] != _SCAN_CACHE_VERSION:
+                    return {}
+                rows = conn.execute(
+                    "SELECT path, mtime, size, artist, song, track_num, length, quality FROM files"
+                )
+                return {row[0]: row[1:] for row in rows}
+        except sqlite3.Error as e:
+            logger.warning(f"Error loading scan cache: {str(e)}")
+            return {}
+    
+    def _save_scan_cache(self, scanned: List[Tuple[MusicFile, float]]):
+        """Replace the scan cache with the files found by the last scan, in one transaction"""
+        if not self.cache_file:
+            return
+        
+        rows = []
+        for music_file, mtime in scanned:
+            metadata = music_file._metadata
+            rows.append((
+                music_file.full_path, mtime, music_file.size, music_file.artist, music_file.song,
+                music_file.track_num,
+                metadata["length"] if metadata else None,
+                metadata["quality"] if metadata else None,
+            ))
+        
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with closing(sqlite3.connect(self.cache_file, isolation_level=None)) as conn:
+                conn.execute("BEGIN")
+                conn.execute("DROP TABLE IF EXISTS files")
+                conn.execute(
+                    "CREATE TABLE files (path TEXT PRIMARY KEY, mtime REAL, size INTEGER, artist TEXT, "
+                    "song TEXT, track_num INTEGER, length TEXT, quality TEXT)"
+                )
+                conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                conn.execute(f"PRAGMA user_version = {_SCAN_CACHE_VERSION}")
+                conn.execute("COMMIT")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Error saving scan cache: {str(e)}")
+    
+    def save_metadata_cache(self, music_files: List[MusicFile]):
+        """Store metadata read after the scan in the scan cache, so the next session doesn't read it again"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        
+        rows = [
+            (music_file._metadata["length"], music_file._metadata["quality"], music_file.full_path)
+            for music_file in music_files if music_file._metadata is not None
+        ]
+        if not rows:
+            return
+        
+        try:
+            with closing(sqlite3.connect(self.cache_file, isolation_level=None)) as conn:
+                conn.execute("BEGIN")
+                conn.executemany("UPDATE files SET length = ?, quality = ? WHERE path = ?", rows)
+                conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.warning(f"Error saving metadata to scan cache: {str(e)}")
+    
     def cancel_scan(self):
         """Cancel an in-progress scan"""
         self.is_scanning = False
         if self.scan_thread and self.scan_thread.is_alive():
             self.scan_thread.join(1.0)  # Wait for thread to terminate
     
+    def _get_text_index(self) -> MusicTextIndex:
+        """Return the text index of the current music files, rebuilding it when they change"""
+        music_files = self.music_files
+        text_index = self._text_index
+        if text_index is None or text_index.music_files is not music_files or len(text_index.texts) != len(music_files):
+            text_index = MusicTextIndex(music_files)
+            self._text_index = text_index
+        return text_index
+    
     def search(self, query: str, threshold: float = 0.6) -> List[Tuple[MusicFile, float]]:
         """
         Search for music files matching the query
@@ -295,36 +675,74 @@ class MusicDatabase:
         if not query.strip():
             return []
         
+        query_lower, query_parts = _prepare_query(query)
+        if not query_parts:
+            return []
+        
+        text_index = self._get_text_index()
+        
+        # Only files containing every query word can match
         results = []
-        for music_file in self.music_files:
-            score = music_file.match_query(query, threshold)
+        for index in text_index.candidates(query_parts):
+            music_file = text_index.music_files[index]
+            score = music_file.match_prepared(query_lower, query_parts, threshold)
             if score >= threshold:
                 results.append((music_file, score))
         
         # Sort by score (descending)
         return sorted(results, key=lambda x: x[1], reverse=True)
     
-    def match_playlist(self, playlist_entries: List[str], threshold: float = 0.6) -> List[Tuple[str, List[Tuple[MusicFile, float]]]]:
+    def match_playlist(self, playlist_entries: List[str], threshold: float = 0.6,
+                       max_matches: Optional[int] = None) -> List[Tuple[str, List[Tuple[MusicFile, float]]]]:
         """
         Match playlist entries to music files
         
         Args:
             playlist_entries: List of playlist entries (text lines)
             threshold: Similarity threshold (0.0 to 1.0)
+            max_matches: Keep only this many best matches per entry (None for all)
             
         Returns:
             List of (playlist_entry, [(music_file, score), ...]) tuples
         """
+        text_index = self._get_text_index()
+        music_files = text_index.music_files
+        all_matches = None
+        
+        # Score the whole playlist in batches with rapidfuzz when available
+        if cpdist is not None and fuzz is not None and threshold > 0.5 and playlist_entries and music_files:
+            all_matches = _match_entries_cpdist(text_index, playlist_entries, threshold)
+        
+        # Otherwise matching is pure CPU work, so spread large playlists across processes
+        workers = os.cpu_count() or 1
+        if all_matches is None and workers > 1 and len(playlist_entries) * len(music_files) >= _PARALLEL_MATCH_MIN_WORK:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_match_worker,
+                    initargs=(music_files,)
+                ) as executor:
+                    all_matches = list(executor.map(
+                        _match_entry_in_worker,
+                        playlist_entries,
+                        itertools.repeat(threshold),
+                        chunksize=max(1, len(playlist_entries) // (workers * 4))
+                    ))
+            except Exception as e:
+                logger.warning(f"Parallel matching failed, falling back to a single process: {str(e)}")
+        
+        if all_matches is None:
+            all_matches = [_match_entry(text_index, entry, threshold) for entry in playlist_entries]
+        
         results = []
-        for entry in playlist_entries:
-            entry_matches = []
-            for music_file in self.music_files:
-                score = music_file.match_query(entry, threshold)
-                if score >= threshold:
-                    entry_matches.append((music_file, score))
+        for entry, matches in zip(playlist_entries, all_matches):
+            entry_matches = [(music_files[index], score) for index, score in matches]
             
             # Sort matches by score (descending) and add to results
-            sorted_matches = sorted(entry_matches, key=lambda x: x[1], reverse=True)
+            if max_matches is not None and max_matches < len(entry_matches):
+                sorted_matches = heapq.nlargest(max_matches, entry_matches, key=lambda x: x[1])
+            else:
+                sorted_matches = sorted(entry_matches, key=lambda x: x[1], reverse=True)
             results.append((entry, sorted_matches))
         
         return results
@@ -337,12 +755,23 @@ class SettingsManager:
         self.config_file = os.path.join(self.config_dir, "config.json")
         self.settings = {
             "directories": [],
-            "extensions": ["mp3", "m4a", "flac", "ogg", "aac", "wav"],
+            "extensions": list(_DEFAULT_EXTENSIONS),
             "similarity_threshold": 70,  # Store as integer 1-100
             "output_directory": "",
-            "last_playlist_file": ""
+            "last_playlist_file": "",
+            "max_matches_per_entry": 10  # Best matches shown per playlist entry (0 for all)
         }
         
+        # Saves are deferred briefly so bursts of changes are written once. _save_lock
+        # guards the settings and timer; _write_lock serializes the file writes so
+        # set() never waits on the disk
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._save_timer = None
+        self._save_count = 0
+        self._last_saved = None
+        self._last_saved_count = 0
+        
         # Create config directory if it doesn't exist
         os.makedirs(self.config_dir, exist_ok=True)
         
@@ -353,7 +782,7 @@ class SettingsManager:
         """Load settings from config file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
                     self.settings.update(json.load(f))
         except Exception as e:
             logger.error(f"Error loading settings: {str(e)}")
@@ -361,8 +790,25 @@ class SettingsManager:
     def save_settings(self):
         """Save settings to config file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            # Snapshot the settings under the lock, then write outside it
+            with self._save_lock:
+                if orjson is not None:
+                    data = orjson.dumps(self.settings, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(self.settings, indent=2).encode('utf-8')
+                self._save_count += 1
+                save_number = self._save_count
+            
+            with self._write_lock:
+                # Skip the write when nothing changed since the last save, or when
+                # a newer snapshot was already written
+                if data == self._last_saved or save_number < self._last_saved_count:
+                    return
+                
+                with open(self.config_file, 'wb') as f:
+                    f.write(data)
+                self._last_saved = data
+                self._last_saved_count = save_number
         except Exception as e:
             logger.error(f"Error saving settings: {str(e)}")
     
@@ -372,8 +818,14 @@ class SettingsManager:
     
     def set(self, key, value):
         """Set a setting value"""
-        self.settings[key] = value
-        self.save_settings()
+        with self._save_lock:
+            self.settings[key] = value
+            
+            # Restart the save timer so a burst of changes is saved once
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(_SETTINGS_SAVE_DELAY, self.save_settings)
+            self._save_timer.start()
 
 class ConsoleTab(ttk.Frame):
     """Tab for console output"""
@@ -453,6 +905,144 @@ class ConsoleLogHandler(logging.Handler):
         # Schedule the message to be displayed in the GUI thread
         self.console_tab.after(0, self.console_tab.log, msg, record.levelno)
 
+def _existing_names(directory: str) -> Set[str]:
+    """Get the casefolded names in a directory, for checking destination names without a stat per try"""
+    with os.scandir(directory) as entries:
+        return {entry.name.casefold() for entry in entries}
+
+def _unique_name(filename: str, taken: Set[str]) -> str:
+    """Return filename, or "name (N).ext" if it is taken, and mark the result as taken"""
+    key = filename.casefold()
+    if key in taken:
+        # Find a unique name with a counter; the name is split and casefolded once
+        # so each try is just string formatting and a set lookup
+        name, ext = os.path.splitext(filename)
+        name_key, ext_key = name.casefold(), ext.casefold()
+        counter = 1
+        while f"{name_key} ({counter}){ext_key}" in taken:
+            counter += 1
+        filename = f"{name} ({counter}){ext}"
+        key = f"{name_key} ({counter}){ext_key}"
+    taken.add(key)
+    return filename
+
+def _bind_threshold_label(scale: ttk.Scale, label: ttk.Label):
+    """Show a scale's value as a percentage in a label, updating at most every few ms while dragging"""
+    pending = None
+    
+    def apply():
+        nonlocal pending
+        pending = None
+        label.config(text=f"{int(float(scale.get()))}%")
+    
+    def on_change(val):
+        nonlocal pending
+        if pending is None:
+            pending = scale.after(_THRESHOLD_LABEL_DELAY, apply)
+    
+    scale.config(command=on_change)
+
+def _fast_copy(src: str, dst: str):
+    """
+    Copy a file and its metadata like shutil.copy2, letting the kernel move the data
+    
+    Uses os.copy_file_range where available, which avoids copying through user space
+    and becomes a reflink on copy-on-write filesystems, then os.sendfile, which also
+    keeps the data in the kernel. Falls back to a regular copy when neither call is
+    supported, e.g. across filesystems or on other platforms.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        # Some filesystems (virtual, FUSE or network mounts) return 0 from the kernel
+        # calls instead of failing, so they only count as done once they have moved
+        # the whole file; anything left is copied by the next method
+        size = os.fstat(fsrc.fileno()).st_size
+        moved = 0
+        copied = False
+        if hasattr(os, "copy_file_range"):
+            try:
+                while True:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+                    if not sent:
+                        break
+                    moved += sent
+            except OSError as e:
+                # Real I/O errors (e.g. a full disk) are raised; otherwise continue
+                # from wherever the kernel copy stopped
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+            copied = moved > 0 and moved >= size
+        if not copied and sys.platform.startswith("linux"):
+            try:
+                # With no offset, sendfile reads from and advances the current position
+                while True:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), None, 1 << 20)
+                    if not sent:
+                        break
+                    moved += sent
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+            copied = moved > 0 and moved >= size
+        if not copied:
+            shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+def _info_text(music_file: MusicFile) -> str:
+    """Info column text for a file; the length stays blank until its metadata has been read"""
+    metadata = music_file._metadata
+    length = metadata.get('length', '') if metadata else ''
+    return f"{length} | {music_file.extension.upper()}"
+
+def _load_metadata_in_background(widget: tk.Misc, rows: List[Tuple[str, MusicFile]], update,
+                                 music_db: Optional["MusicDatabase"] = None) -> threading.Event:
+    """
+    Read the metadata of (tree item id, music file) rows on a worker thread
+    
+    update(rows) is called on the Tk thread with each batch of rows whose metadata
+    is ready. Newly read metadata is saved to music_db's scan cache when the worker
+    finishes. Returns an event that stops the worker when set.
+    """
+    cancelled = threading.Event()
+    
+    def worker():
+        read_files = []
+        try:
+            post_batches(read_files)
+        finally:
+            if music_db is not None:
+                music_db.save_metadata_cache(read_files)
+    
+    def post_batches(read_files):
+        batch = []
+        last_post = time.monotonic()
+        for item_id, music_file in rows:
+            if cancelled.is_set():
+                return
+            if music_file._metadata is None:
+                music_file.metadata  # Reads the file on first access
+                read_files.append(music_file)
+            batch.append((item_id, music_file))
+            
+            now = time.monotonic()
+            if now - last_post >= _METADATA_UPDATE_INTERVAL:
+                last_post = now
+                try:
+                    widget.after(0, update, batch)
+                except (RuntimeError, tk.TclError):
+                    # The window was closed
+                    return
+                batch = []
+        
+        if batch:
+            try:
+                widget.after(0, update, batch)
+            except (RuntimeError, tk.TclError):
+                pass
+    
+    if rows:
+        threading.Thread(target=worker, daemon=True).start()
+    return cancelled
+
 class PlaylistMatchPreview(tk.Toplevel):
     """Preview window for playlist matches"""
     
@@ -466,6 +1056,14 @@ class PlaylistMatchPreview(tk.Toplevel):
         self.total_entries = len(playlist_matches)
         self.matched_entries = sum(1 for _, matches in playlist_matches if matches)
         self.total_matches = sum(len(matches) for _, matches in playlist_matches)
+        self.all_rows = []
+        self.row_paths: Dict[str, Optional[str]] = {}  # Tree item id -> file path (None for no match)
+        self.path_items: Dict[str, List[str]] = {}  # File path -> tree item ids (a file can match several entries)
+        self.rows_inserted = 0
+        self.insert_pending = False
+        self.copy_progress: Optional[Tuple[int, int, int]] = None  # (copied, failed, total) while copying
+        self.copy_progress_lock = threading.Lock()
+        self.copy_progress_logged = None
         
         # Set window properties
         self.title("Playlist Match Preview")
@@ -508,7 +1106,7 @@ class PlaylistMatchPreview(tk.Toplevel):
         threshold_scale.pack(side=tk.LEFT, padx=(0, 5))
         
         threshold_value = ttk.Label(threshold_frame, text=f"{self.threshold_var.get()}%")
-        threshold_scale.config(command=lambda val: threshold_value.config(text=f"{int(float(val))}%"))
+        _bind_threshold_label(threshold_scale, threshold_value)
         threshold_value.pack(side=tk.LEFT, padx=(0, 10))
         
         retry_button = ttk.Button(
@@ -548,12 +1146,12 @@ class PlaylistMatchPreview(tk.Toplevel):
         )
         
         # Set up scrollbars
-        vsb = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.vsb = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
         hsb = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tree.configure(yscrollcommand=self.on_tree_scroll, xscrollcommand=hsb.set)
         
         # Pack scrollbars
-        vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.vsb.pack(side=tk.RIGHT, fill=tk.Y)
         hsb.pack(side=tk.BOTTOM, fill=tk.X)
         self.tree.pack(fill=tk.BOTH, expand=True)
         
@@ -592,12 +1190,12 @@ class PlaylistMatchPreview(tk.Toplevel):
         )
         clear_button.pack(side=tk.LEFT, padx=(0, 5))
         
-        copy_button = ttk.Button(
+        self.copy_button = ttk.Button(
             buttons_frame,
             text="Copy Selected Files",
             command=self.copy_selected
         )
-        copy_button.pack(side=tk.RIGHT, padx=(5, 0))
+        self.copy_button.pack(side=tk.RIGHT, padx=(5, 0))
         
         cancel_button = ttk.Button(
             buttons_frame,
@@ -612,80 +1210,119 @@ class PlaylistMatchPreview(tk.Toplevel):
     def populate_table(self):
         """Populate the table with playlist matches"""
         # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
+        self.row_paths.clear()
+        self.path_items.clear()
         
-        # Add playlist entries and matches
+        # Build all rows up front as (entry, music_file, score); they are inserted
+        # into the tree in chunks as the user scrolls down
+        self.all_rows = []
         for entry, matches in self.playlist_matches:
             if not matches:
+                self.all_rows.append((entry, None, None))
+            else:
+                for i, (music_file, score) in enumerate(matches):
+                    # Only show entry for first match
+                    self.all_rows.append((entry if i == 0 else "", music_file, score))
+        
+        # Configure row appearance
+        self.tree.tag_configure("no_match", background="#FFCCCC")
+        
+        self.rows_inserted = 0
+        self.insert_more_rows()
+        
+        # Adjust column widths to content
+        font = tk.font.Font()
+        for col in self.tree["columns"]:
+            self.tree.column(col, width=font.measure(col) + 20)
+    
+    def insert_more_rows(self):
+        """Insert the next chunk of rows into the table"""
+        self.insert_pending = False
+        end = min(self.rows_inserted + _PREVIEW_ROW_CHUNK, len(self.all_rows))
+        pending_metadata = []
+        
+        for entry, music_file, score in self.all_rows[self.rows_inserted:end]:
+            if music_file is None:
                 # Add entry with no matches
-                self.tree.insert(
+                item_id = self.tree.insert(
                     "",
                     tk.END,
                     values=("", entry, "<No matches found>", "", "", ""),
                     tags=("no_match",)
                 )
+                self.row_paths[item_id] = None
             else:
-                # Add each match for this entry
-                for i, (music_file, score) in enumerate(matches):
-                    # Create a unique ID for this item
-                    item_id = self.tree.insert(
-                        "",
-                        tk.END,
-                        values=(
-                            "☐",  # Unchecked checkbox
-                            entry if i == 0 else "",  # Only show entry for first match
-                            f"{music_file.artist} - {music_file.song}" if music_file.artist and music_file.song else music_file.filename,
-                            f"{score:.0%}",
-                            music_file.full_path,
-                            f"{music_file.metadata.get('length', '')} | {music_file.extension.upper()}"
-                        ),
-                        tags=("match",)
-                    )
-                    # Store the MusicFile object with the item
-                    self.tree.item(item_id, tags=(item_id,))
+                item_id = self.tree.insert(
+                    "",
+                    tk.END,
+                    values=(
+                        "☑" if music_file.full_path in self.selected_files else "☐",
+                        entry,
+                        f"{music_file.artist} - {music_file.song}" if music_file.artist and music_file.song else music_file.filename,
+                        f"{score:.0%}",
+                        music_file.full_path,
+                        _info_text(music_file)
+                    ),
+                    tags=("match",)
+                )
+                self.row_paths[item_id] = music_file.full_path
+                self.path_items.setdefault(music_file.full_path, []).append(item_id)
+                if music_file._metadata is None:
+                    pending_metadata.append((item_id, music_file))
         
-        # Configure row appearance
-        self.tree.tag_configure("no_match", background="#FFCCCC")
+        self.rows_inserted = end
         
-        # Adjust column widths to content
-        for col in self.tree["columns"]:
-            self.tree.column(col, width=tk.font.Font().measure(col) + 20)
+        # Lengths are filled in once the files have been read, off the UI thread
+        _load_metadata_in_background(self, pending_metadata, self.show_metadata, self.parent.music_db)
+    
+    def show_metadata(self, rows):
+        """Fill in the Info column of rows whose metadata has been read"""
+        for item_id, music_file in rows:
+            if self.tree.exists(item_id):
+                self.tree.set(item_id, "Info", _info_text(music_file))
+    
+    def on_tree_scroll(self, first, last):
+        """Update the scrollbar and load more rows when the end of the table comes into view"""
+        self.vsb.set(first, last)
+        if float(last) >= 0.9 and self.rows_inserted < len(self.all_rows) and not self.insert_pending:
+            self.insert_pending = True
+            self.after_idle(self.insert_more_rows)
     
     def toggle_selection(self, event):
         """Toggle selection of a row when clicked"""
         region = self.tree.identify_region(event.x, event.y)
         if region == "cell":
             item = self.tree.identify_row(event.y)
-            if item:
-                values = list(self.tree.item(item, "values"))
-                if values and len(values) >= 5:
-                    if values[0] == "☐":  # Unchecked
-                        values[0] = "☑"  # Checked
-                        self.selected_files.add(values[4])  # Add path to selected
-                    else:
-                        values[0] = "☐"  # Unchecked
-                        if values[4] in self.selected_files:
-                            self.selected_files.remove(values[4])
-                    
-                    self.tree.item(item, values=values)
+            path = self.row_paths.get(item)
+            if path:
+                if path not in self.selected_files:
+                    self.selected_files.add(path)  # Add path to selected
+                    mark = "☑"  # Checked
+                else:
+                    self.selected_files.remove(path)
+                    mark = "☐"  # Unchecked
+                
+                # Selection is per file, so update every row showing this file
+                for path_item in self.path_items[path]:
+                    self.tree.set(path_item, "Select", mark)
     
     def select_all(self):
         """Select all files"""
-        for item in self.tree.get_children():
-            values = list(self.tree.item(item, "values"))
-            if values and len(values) >= 5 and values[2] != "<No matches found>":
-                values[0] = "☑"  # Checked
-                self.tree.item(item, values=values)
-                self.selected_files.add(values[4])  # Add path to selected
+        # Include rows that haven't been inserted into the table yet
+        for _, music_file, _ in self.all_rows:
+            if music_file is not None:
+                self.selected_files.add(music_file.full_path)
+        
+        for item, path in self.row_paths.items():
+            if path:
+                self.tree.set(item, "Select", "☑")  # Checked
     
     def clear_selection(self):
         """Clear all selections"""
-        for item in self.tree.get_children():
-            values = list(self.tree.item(item, "values"))
-            if values and len(values) >= 5:
-                values[0] = "☐"  # Unchecked
-                self.tree.item(item, values=values)
+        for item, path in self.row_paths.items():
+            if path:
+                self.tree.set(item, "Select", "☐")  # Unchecked
         self.selected_files.clear()
     
     def browse_output(self):
@@ -725,64 +1362,100 @@ class PlaylistMatchPreview(tk.Toplevel):
             messagebox.showerror("Error", f"Failed to create output directory: {str(e)}")
             return
         
-        # Start copying in a separate thread to keep the UI responsive
+        # Start copying in a separate thread to keep the UI responsive; only one copy
+        # runs at a time, so the button stays disabled until finish_copy
+        files = list(self.selected_files)
+        self.copy_progress = (0, 0, len(files))
+        self.copy_progress_logged = self.copy_progress
+        self.copy_button.config(state=tk.DISABLED)
         threading.Thread(
             target=self._copy_worker,
-            args=(list(self.selected_files), output_dir),
+            args=(files, output_dir),
             daemon=True
         ).start()
+        
+        # Report progress from the main loop at a fixed rate rather than per file
+        self.after(200, self.drain_copy_progress)
+    
+    def drain_copy_progress(self):
+        """Log the latest copy progress and keep polling until the copy finishes"""
+        with self.copy_progress_lock:
+            progress = self.copy_progress
+        if progress is None:
+            return
+        
+        self.log_copy_progress(progress)
+        self.after(200, self.drain_copy_progress)
+    
+    def log_copy_progress(self, progress):
+        """Log copy progress if it changed since the last report"""
+        if progress != self.copy_progress_logged:
+            self.copy_progress_logged = progress
+            copied, failed, total = progress
+            logger.info(f"Copied {copied} of {total} files...")
+    
+    def finish_copy(self, output_dir, copied, failed, error=None):
+        """Report the result of a copy on the main loop and allow copying again"""
+        # Log the final progress before clearing it, so the last files are never unreported
+        with self.copy_progress_lock:
+            progress = self.copy_progress
+            self.copy_progress = None
+        if progress is not None:
+            self.log_copy_progress(progress)
+        
+        self.copy_button.config(state=tk.NORMAL)
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Error during copy operation: {error}")
+            return
+        
+        logger.info(f"Copy complete. Successfully copied {copied} files. Failed: {failed}")
+        messagebox.showinfo("Copy Complete", f"Successfully copied {copied} files to {output_dir}.\nFailed: {failed}")
     
     def _copy_worker(self, files, output_dir):
         """Worker thread for copying files"""
+        copied = 0
+        failed = 0
+        error = None
         try:
             # Update the UI to show we're starting
             self.after(0, lambda: logger.info(f"Starting to copy {len(files)} files to {output_dir}..."))
             
-            copied = 0
-            failed = 0
+            # Destination names are checked against the files already in the output
+            # directory plus the names taken so far, under a lock so parallel copies
+            # never pick the same name
+            name_lock = threading.Lock()
+            taken = _existing_names(output_dir)
             
-            for file_path in files:
-                try:
-                    filename = os.path.basename(file_path)
-                    dest_path = os.path.join(output_dir, filename)
-                    
-                    # Check if file already exists
-                    if os.path.exists(dest_path):
-                        # Find a unique name with a counter
-                        name, ext = os.path.splitext(filename)
-                        counter = 1
-                        while os.path.exists(os.path.join(output_dir, f"{name} ({counter}){ext}")):
-                            counter += 1
-                        dest_path = os.path.join(output_dir, f"{name} ({counter}){ext}")
-                    
-                    # Copy the file
-                    shutil.copy2(file_path, dest_path)
-                    copied += 1
-                    
-                    # Update progress
-                    if copied % 5 == 0 or copied == len(files):
-                        self.after(0, lambda c=copied, t=len(files): 
-                            logger.info(f"Copied {c} of {t} files..."))
+            def copy_one(file_path):
+                """Copy a single file to a unique name in the output directory"""
+                with name_lock:
+                    filename = _unique_name(os.path.basename(file_path), taken)
+                dest_path = os.path.join(output_dir, filename)
                 
-                except Exception as e:
-                    logger.error(f"Failed to copy {file_path}: {str(e)}")
-                    failed += 1
-            
-            # Show completion message
-            self.after(0, lambda c=copied, f=failed: 
-                logger.info(f"Copy complete. Successfully copied {c} files. Failed: {f}"))
-            
-            # Show a message box when done
-            self.after(0, lambda c=copied, f=failed:
-                messagebox.showinfo("Copy Complete", 
-                                   f"Successfully copied {c} files to {output_dir}.\nFailed: {f}")
-            )
+                # Copy the file
+                _fast_copy(file_path, dest_path)
             
+            # Copy several files at once so the disk I/O overlaps
+            with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+                futures = {executor.submit(copy_one, file_path): file_path for file_path in files}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        copied += 1
+                    except Exception as e:
+                        logger.error(f"Failed to copy {futures[future]}: {str(e)}")
+                        failed += 1
+                    
+                    # Update progress; the main loop picks it up in drain_copy_progress
+                    with self.copy_progress_lock:
+                        self.copy_progress = (copied, failed, len(files))
         except Exception as e:
             logger.error(f"Error during copy operation: {str(e)}")
-            self.after(0, lambda e=str(e):
-                messagebox.showerror("Error", f"Error during copy operation: {e}")
-            )
+            error = str(e)
+        finally:
+            # Stop the progress polling and show the result from the main loop
+            self.after(0, self.finish_copy, output_dir, copied, failed, error)
 
 class ManualSearchTab(ttk.Frame):
     """Tab for manual searching"""
@@ -792,6 +1465,8 @@ class ManualSearchTab(ttk.Frame):
         self.parent = parent
         self.music_db = music_db
         self.settings_manager = settings_manager
+        self.row_paths: Dict[str, str] = {}  # Tree item id -> file path
+        self.metadata_loader: Optional[threading.Event] = None  # Stops the previous search's metadata reads
         self.setup_ui()
     
     def setup_ui(self):
@@ -838,7 +1513,7 @@ class ManualSearchTab(ttk.Frame):
         threshold_scale.grid(row=1, column=1, sticky=tk.W, pady=(10, 0))
         
         self.threshold_label = ttk.Label(search_frame, text=f"{self.threshold_var.get()}%")
-        threshold_scale.config(command=lambda val: self.threshold_label.config(text=f"{int(float(val))}%"))
+        _bind_threshold_label(threshold_scale, self.threshold_label)
         self.threshold_label.grid(row=1, column=2, sticky=tk.W, pady=(10, 0))
         
         # Configure grid weights
@@ -913,7 +1588,7 @@ class ManualSearchTab(ttk.Frame):
             return
         
         # Get the file path
-        path = self.tree.item(selected[0], "values")[4]
+        path = self.row_paths[selected[0]]
         
         # Get output directory
         output_dir = self.settings_manager.get("output_directory", "")
@@ -928,21 +1603,12 @@ class ManualSearchTab(ttk.Frame):
             os.makedirs(output_dir, exist_ok=True)
         
         try:
-            # Copy the file
-            filename = os.path.basename(path)
+            # Pick a name that doesn't clash with the files already there
+            filename = _unique_name(os.path.basename(path), _existing_names(output_dir))
             dest_path = os.path.join(output_dir, filename)
             
-            # Check if file already exists
-            if os.path.exists(dest_path):
-                # Find a unique name with a counter
-                name, ext = os.path.splitext(filename)
-                counter = 1
-                while os.path.exists(os.path.join(output_dir, f"{name} ({counter}){ext}")):
-                    counter += 1
-                dest_path = os.path.join(output_dir, f"{name} ({counter}){ext}")
-            
             # Copy the file
-            shutil.copy2(path, dest_path)
+            _fast_copy(path, dest_path)
             
             messagebox.showinfo("Copy Complete", f"File copied to {dest_path}")
             logger.info(f"Copied {path} to {dest_path}")
@@ -958,7 +1624,7 @@ class ManualSearchTab(ttk.Frame):
             return
         
         # Get the file path
-        path = self.tree.item(selected[0], "values")[4]
+        path = self.row_paths[selected[0]]
         
         # Copy to clipboard
         self.clipboard_clear()
@@ -973,7 +1639,7 @@ class ManualSearchTab(ttk.Frame):
             return
         
         # Get the file path
-        path = self.tree.item(selected[0], "values")[4]
+        path = self.row_paths[selected[0]]
         directory = os.path.dirname(path)
         
         try:
@@ -981,10 +1647,9 @@ class ManualSearchTab(ttk.Frame):
             if os.name == 'nt':  # Windows
                 os.startfile(directory)
             elif os.name == 'posix':  # macOS, Linux
-                if sys.platform == 'darwin':  # macOS
-                    os.system(f'open "{directory}"')
-                else:  # Linux
-                    os.system(f'xdg-open "{directory}"')
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'  # macOS / Linux
+                subprocess.Popen([opener, directory], stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL, start_new_session=True)
             
             logger.info(f"Opened folder: {directory}")
         
@@ -999,17 +1664,16 @@ class ManualSearchTab(ttk.Frame):
             return
         
         # Get the file path
-        path = self.tree.item(item, "values")[4]
+        path = self.row_paths[item]
         
         try:
             # Try to open the file with the default application
             if os.name == 'nt':  # Windows
                 os.startfile(path)
             elif os.name == 'posix':  # macOS, Linux
-                if sys.platform == 'darwin':  # macOS
-                    os.system(f'open "{path}"')
-                else:  # Linux
-                    os.system(f'xdg-open "{path}"')
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'  # macOS / Linux
+                subprocess.Popen([opener, path], stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL, start_new_session=True)
             
             logger.info(f"Playing file: {path}")
         
@@ -1028,8 +1692,11 @@ class ManualSearchTab(ttk.Frame):
         threshold = self.threshold_var.get() / 100.0
         
         # Clear the tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
+        self.row_paths.clear()
+        if self.metadata_loader is not None:
+            self.metadata_loader.set()
+            self.metadata_loader = None
         
         # Check if we need to scan first
         if not self.music_db.music_files:
@@ -1043,22 +1710,39 @@ class ManualSearchTab(ttk.Frame):
             messagebox.showinfo("No Results", "No matching files found.")
             return
         
-        # Add results to the tree
+        # Insert the rows in one tight loop so the tree is redrawn once; lengths not
+        # read yet are filled in from a background thread so the UI never waits on the files
+        insert = self.tree.insert
+        row_paths = self.row_paths
+        pending_metadata = []
         for music_file, score in results:
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    music_file.filename,
-                    music_file.artist,
-                    music_file.song,
-                    f"{score:.0%}",
-                    music_file.full_path,
-                    f"{music_file.metadata.get('length', '')} | {music_file.extension.upper()}"
-                )
-            )
+            item_id = insert("", tk.END, values=(
+                music_file.filename,
+                music_file.artist,
+                music_file.song,
+                f"{score:.0%}",
+                music_file.full_path,
+                _info_text(music_file)
+            ))
+            row_paths[item_id] = music_file.full_path
+            if music_file._metadata is None:
+                pending_metadata.append((item_id, music_file))
+        
+        self.metadata_loader = _load_metadata_in_background(
+            self, pending_metadata, self.show_metadata, self.music_db
+        )
         
         logger.info(f"Found {len(results)} matches for query: {query}")
+    
+    def show_metadata(self, rows):
+        """Fill in the Info column of rows whose metadata has been read"""
+        for item_id, music_file in rows:
+            if self.tree.exists(item_id):
+                self.tree.set(item_id, "Info", _info_text(music_file))
+
+def _parse_lines(text: str) -> List[str]:
+    """Split playlist text into stripped, non-empty entries"""
+    return [line for line in map(str.strip, text.splitlines()) if line]
 
 class PlaylistMatchTab(ttk.Frame):
     """Tab for matching playlists to music files"""
@@ -1070,11 +1754,16 @@ class PlaylistMatchTab(ttk.Frame):
         self.settings_manager = settings_manager
         self.playlist_entries = []
         self.playlist_matches = []
-        self.current_threshold = self.settings_manager.get("similarity_threshold", 70) / 100.0
         self.setup_ui()
     
     def setup_ui(self):
         """Set up the UI for playlist matching"""
+        # Saved settings used to initialize the controls
+        threshold = self.settings_manager.get("similarity_threshold", 70)
+        last_playlist_file = self.settings_manager.get("last_playlist_file", "")
+        output_directory = self.settings_manager.get("output_directory", "")
+        self.current_threshold = threshold / 100.0
+        
         # Main layout
         main_frame = ttk.Frame(self, padding=10)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -1086,7 +1775,7 @@ class PlaylistMatchTab(ttk.Frame):
         # File selection controls
         ttk.Label(file_frame, text="Playlist File:").grid(row=0, column=0, padx=(0, 5), sticky=tk.W)
         
-        self.file_var = tk.StringVar(value=self.settings_manager.get("last_playlist_file", ""))
+        self.file_var = tk.StringVar(value=last_playlist_file)
         file_entry = ttk.Entry(file_frame, textvariable=self.file_var, width=50)
         file_entry.grid(row=0, column=1, padx=(0, 5), sticky=tk.EW)
         
@@ -1127,7 +1816,7 @@ class PlaylistMatchTab(ttk.Frame):
         # Threshold slider
         ttk.Label(options_frame, text="Similarity Threshold:").grid(row=0, column=0, padx=(0, 5), sticky=tk.W)
         
-        self.threshold_var = tk.IntVar(value=self.settings_manager.get("similarity_threshold", 70))
+        self.threshold_var = tk.IntVar(value=threshold)
         threshold_scale = ttk.Scale(
             options_frame,
             from_=1,
@@ -1139,13 +1828,13 @@ class PlaylistMatchTab(ttk.Frame):
         threshold_scale.grid(row=0, column=1, sticky=tk.W)
         
         self.threshold_label = ttk.Label(options_frame, text=f"{self.threshold_var.get()}%")
-        threshold_scale.config(command=lambda val: self.threshold_label.config(text=f"{int(float(val))}%"))
+        _bind_threshold_label(threshold_scale, self.threshold_label)
         self.threshold_label.grid(row=0, column=2, sticky=tk.W)
         
         # Output directory
         ttk.Label(options_frame, text="Output Directory:").grid(row=1, column=0, padx=(0, 5), sticky=tk.W, pady=(10, 0))
         
-        self.output_var = tk.StringVar(value=self.settings_manager.get("output_directory", ""))
+        self.output_var = tk.StringVar(value=output_directory)
         output_entry = ttk.Entry(options_frame, textvariable=self.output_var, width=40)
         output_entry.grid(row=1, column=1, padx=(0, 5), sticky=tk.EW, pady=(10, 0))
         
@@ -1204,12 +1893,8 @@ class PlaylistMatchTab(ttk.Frame):
             return
         
         try:
-            # Read the playlist file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Filter out empty lines
-            lines = [line.strip() for line in lines if line.strip()]
+            # Read the playlist file, skipping empty lines
+            lines = _parse_lines(Path(file_path).read_text(encoding='utf-8'))
             
             self.playlist_entries = lines
             
@@ -1239,7 +1924,7 @@ class PlaylistMatchTab(ttk.Frame):
                 return
             
             # Split the text into lines
-            self.playlist_entries = [line.strip() for line in text.split('\n') if line.strip()]
+            self.playlist_entries = _parse_lines(text)
         
         # Check if we need to scan first
         if not self.music_db.music_files:
@@ -1260,7 +1945,9 @@ class PlaylistMatchTab(ttk.Frame):
             output_dir = os.path.join(os.getcwd(), "export")
         
         # Match playlist entries to music files
-        self.playlist_matches = self.music_db.match_playlist(self.playlist_entries, self.current_threshold)
+        self.playlist_matches = self.music_db.match_playlist(
+            self.playlist_entries, self.current_threshold, self.get_max_matches()
+        )
         
         # Create a preview window
         preview = PlaylistMatchPreview(
@@ -1272,6 +1959,11 @@ class PlaylistMatchTab(ttk.Frame):
         
         logger.info(f"Found matches for {sum(1 for _, matches in self.playlist_matches if matches)} of {len(self.playlist_entries)} playlist entries")
     
+    def get_max_matches(self) -> Optional[int]:
+        """Return the number of matches to keep per playlist entry, or None for all"""
+        max_matches = self.settings_manager.get("max_matches_per_entry", 10)
+        return max_matches if max_matches and max_matches > 0 else None
+    
     def retry_playlist_match(self, new_threshold):
         """Retry matching with a new threshold"""
         self.current_threshold = new_threshold
@@ -1281,7 +1973,9 @@ class PlaylistMatchTab(ttk.Frame):
         self.settings_manager.set("similarity_threshold", int(new_threshold * 100))
         
         # Match playlist entries to music files
-        self.playlist_matches = self.music_db.match_playlist(self.playlist_entries, self.current_threshold)
+        self.playlist_matches = self.music_db.match_playlist(
+            self.playlist_entries, self.current_threshold, self.get_max_matches()
+        )
         
         # Get the output directory
         output_dir = self.output_var.get().strip()
@@ -1305,8 +1999,8 @@ class SpotifyExtractorTab(ttk.Frame):
         super().__init__(parent)
         self.parent = parent
         self.spotify_extractor = None
+        self.extractor_loaded = False
         self.setup_ui()
-        self.load_spotify_extractor()
     
     def setup_ui(self):
         """Set up the UI wrapper for Spotify extractor"""
@@ -1324,7 +2018,11 @@ class SpotifyExtractorTab(ttk.Frame):
         self.status_label.pack(expand=True, pady=20)
     
     def load_spotify_extractor(self):
-        """Try to load the Spotify playlist extractor"""
+        """Try to load the Spotify playlist extractor (only the first time this is called)"""
+        if self.extractor_loaded:
+            return
+        self.extractor_loaded = True
+        
         try:
             # Import the SpotifyExtractorGUI class from the module
             from spotify_extractor import SpotifyExtractorGUI
@@ -1347,6 +2045,7 @@ class SpotifyExtractorTab(ttk.Frame):
         
         except Exception as e:
             logger.error(f"Error loading Spotify extractor: {str(e)}")
+            import traceback
             error_details = traceback.format_exc()
             logger.debug(f"Traceback: {error_details}")
             
@@ -1368,14 +2067,15 @@ class MusicPlaylistManagerApp:
         self.settings_manager = SettingsManager()
         
         # Create the music database
-        self.music_db = MusicDatabase()
+        self.music_db = MusicDatabase(os.path.join(self.settings_manager.config_dir, "scan_cache.db"))
         
         # Load directories from settings
         for directory in self.settings_manager.get("directories", []):
             self.music_db.add_directory(directory)
         
         # Load file extensions from settings
-        self.music_db.set_extensions(set(self.settings_manager.get("extensions", ["mp3", "m4a", "flac", "ogg", "aac", "wav"])))
+        self.enabled_extensions = frozenset(self.settings_manager.get("extensions", _DEFAULT_EXTENSIONS))
+        self.music_db.set_extensions(self.enabled_extensions)
         
         # Set up the UI
         self.setup_ui()
@@ -1403,8 +2103,8 @@ class MusicPlaylistManagerApp:
         self.dir_listbox.config(yscrollcommand=dir_scrollbar.set)
         
         # Populate directory list
-        for directory in self.music_db.directories:
-            self.dir_listbox.insert(tk.END, directory)
+        if self.music_db.directories:
+            self.dir_listbox.insert(tk.END, *self.music_db.directories)
         
         # Directory buttons
         dir_buttons_frame = ttk.Frame(dir_frame)
@@ -1430,14 +2130,10 @@ class MusicPlaylistManagerApp:
         
         # Extension variables
         self.extension_vars = {}
-        extensions = ["mp3", "m4a", "flac", "ogg", "aac", "wav"]
-        
-        # Get extensions from settings
-        enabled_extensions = set(self.settings_manager.get("extensions", extensions))
         
         # Create a checkbox for each extension
-        for i, ext in enumerate(extensions):
-            var = tk.BooleanVar(value=ext in enabled_extensions)
+        for i, ext in enumerate(_DEFAULT_EXTENSIONS):
+            var = tk.BooleanVar(value=ext in self.enabled_extensions)
             self.extension_vars[ext] = var
             
             cb = ttk.Checkbutton(
@@ -1483,9 +2179,11 @@ class MusicPlaylistManagerApp:
         self.playlist_tab = PlaylistMatchTab(self.notebook, self.music_db, self.settings_manager)
         self.notebook.add(self.playlist_tab, text="Playlist Matching")
         
-        # Create Spotify Extractor tab
+        # Create Spotify Extractor tab; the extractor module is imported the first
+        # time the tab is shown, so it doesn't slow down startup
         self.spotify_tab = SpotifyExtractorTab(self.notebook)
         self.notebook.add(self.spotify_tab, text="Spotify Extractor")
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         
         # Create console tab
         self.console_tab = ConsoleTab(self.notebook)
@@ -1504,7 +2202,7 @@ class MusicPlaylistManagerApp:
         
         # Log application start
         logger.info(f"Music Playlist Manager v{__version__} started")
-        logger.info(f"Loaded {len(self.music_db.directories)} directories and {len(enabled_extensions)} file extensions")
+        logger.info(f"Loaded {len(self.music_db.directories)} directories and {len(self.enabled_extensions)} file extensions")
     
     def add_directory(self):
         """Add a directory to scan"""
@@ -1535,9 +2233,18 @@ class MusicPlaylistManagerApp:
             self.settings_manager.set("directories", self.music_db.directories)
             logger.info(f"Removed directory: {directory}")
     
+    def on_tab_changed(self, event):
+        """Load the Spotify extractor the first time its tab is selected"""
+        if self.notebook.select() == str(self.spotify_tab):
+            self.spotify_tab.load_spotify_extractor()
+    
     def update_extensions(self):
         """Update file extensions based on checkboxes"""
-        enabled_extensions = {ext for ext, var in self.extension_vars.items() if var.get()}
+        enabled_extensions = frozenset(ext for ext, var in self.extension_vars.items() if var.get())
+        if enabled_extensions == self.enabled_extensions:
+            return
+        
+        self.enabled_extensions = enabled_extensions
         self.music_db.set_extensions(enabled_extensions)
         self.settings_manager.set("extensions", list(enabled_extensions))
         logger.info(f"Updated file extensions: {', '.join(enabled_extensions)}")
@@ -1552,8 +2259,8 @@ class MusicPlaylistManagerApp:
         # Start the scan
         logger.info(f"Starting scan of {len(self.music_db.directories)} directories...")
         
-        # Display progress bar
-        self.progress_bar.config(value=0, maximum=100)
+        # Display progress bar; the number of files isn't known until the scan ends
+        self.progress_bar.config(mode="indeterminate", value=0, maximum=100)
         self.progress_bar.pack(side=tk.TOP, fill=tk.X, expand=True)
         
         # Disable scan button during scan
@@ -1568,10 +2275,13 @@ class MusicPlaylistManagerApp:
         
         if total > 0:
             progress = (current / total) * 100
-            self.progress_bar.config(value=progress)
+            self.progress_bar.config(mode="determinate", value=progress)
+        elif current > 0:
+            # Move the indeterminate bar once per progress report
+            self.progress_bar.step()
         
         # If scan is complete, re-enable the scan button
-        if current == total or message.startswith("Error") or message.endswith("cancelled."):
+        if message.startswith("Scan complete") or message.startswith("Error") or message.endswith("cancelled."):
             self.scan_button.config(state=tk.NORMAL)
             
             # Hide progress bar after a delay
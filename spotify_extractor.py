@@ -2,13 +2,43 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import re
 import requests
+from requests.adapters import HTTPAdapter
 import base64
 import configparser
 import os
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Callable
 
+# Use orjson for parsing API responses if available, otherwise fall back to requests' json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Playlist ID in a playlist link (open.spotify.com/playlist/ID) or URI (spotify:playlist:ID)
+_PLAYLIST_ID_RE = re.compile(r'(?:spotify\.com/playlist/|spotify:playlist:)([a-zA-Z0-9]+)')
+
+# Tracks returned per request by the playlist tracks endpoint (the API maximum)
+_PAGE_SIZE = 100
+
+# Only the parts of each playlist page that are used, which keeps responses small
+_TRACK_FIELDS = "total,items(track(name,artists(name)))"
+
+# Retries for a request that is rate limited (429) or hits a server error (5xx)
+_MAX_RETRIES = 5
+
+# Longest wait in seconds before a retry; a longer Retry-After fails the request instead
+_MAX_RETRY_DELAY = 60
+
+# Minimum seconds between progress callbacks while fetching pages
+_PROGRESS_INTERVAL = 0.1
+
+# Playlist pages fetched at the same time, kept low to stay under Spotify's rate limit
+_PAGE_WORKERS = 10
+
 class SpotifyPlaylistExtractor:
     """
     Handles Spotify playlist extraction
@@ -25,8 +55,22 @@ class SpotifyPlaylistExtractor:
         self.client_id = client_id or ""
         self.client_secret = client_secret or ""
         self.token = None
+        self.token_expiry = 0.0
         self.is_extracting = False
         
+        # Set on cancellation to wake up requests waiting to be retried
+        self.cancel_event = threading.Event()
+        
+        # Whether access tokens are cached in the config file between runs (off unless
+        # enabled, e.g. by the GUI when credentials are remembered)
+        self.cache_token = False
+        self.auth_lock = threading.Lock()
+        
+        # One session for all API calls so connections are kept alive between
+        # requests, with enough pooled connections for the concurrent page fetches
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=_PAGE_WORKERS))
+        
         # Configuration file path
         self.config_file = os.path.join(str(Path.home()), ".spotify_extractor_config.ini")
         
@@ -63,7 +107,9 @@ class SpotifyPlaylistExtractor:
             save_client_id = client_id or self.client_id
             save_client_secret = client_secret or self.client_secret
             
+            # Keep the other sections (e.g. the token cache)
             config = configparser.ConfigParser()
+            config.read(self.config_file)
             config['Spotify'] = {
                 'client_id': save_client_id,
                 'client_secret': save_client_secret
@@ -74,10 +120,56 @@ class SpotifyPlaylistExtractor:
         except Exception:
             return False
     
-    def authenticate(self):
+    def load_cached_token(self):
+        """
+        Use the access token cached in the config file if it is for the
+        current client ID and hasn't expired
+        
+        Returns:
+            bool: True if a cached token was loaded, False otherwise
+        """
+        try:
+            config = configparser.ConfigParser()
+            config.read(self.config_file)
+            if 'Cache' not in config:
+                return False
+            
+            cache = config['Cache']
+            token = cache.get('token', '')
+            expiry = cache.getfloat('token_expiry', 0.0)
+            if not token or cache.get('client_id') != self.client_id or time.time() >= expiry:
+                return False
+            
+            self.token = token
+            self.token_expiry = expiry
+            self.session.headers["Authorization"] = f"Bearer {self.token}"
+            return True
+        except Exception:
+            # A broken cache just means authenticating again
+            return False
+    
+    def save_cached_token(self):
+        """Cache the current access token and its expiry in the config file"""
+        try:
+            config = configparser.ConfigParser()
+            config.read(self.config_file)
+            config['Cache'] = {
+                'client_id': self.client_id,
+                'token': self.token,
+                'token_expiry': str(self.token_expiry)
+            }
+            with open(self.config_file, 'w') as f:
+                config.write(f)
+        except Exception:
+            pass
+    
+    def authenticate(self, use_cache: bool = True):
         """
         Get Spotify API access token
         
+        Args:
+            use_cache (bool): Reuse a cached token that hasn't expired
+        
         Returns:
             Tuple of (success, message)
         """
@@ -85,6 +177,9 @@ class SpotifyPlaylistExtractor:
         if not self.client_id or not self.client_secret:
             return False, "Missing Spotify API credentials"
         
+        if use_cache and self.cache_token and self.load_cached_token():
+            return True, "Using cached access token"
+        
         auth_url = "https://accounts.spotify.com/api/token"
         auth_header = base64.b64encode(f"{self.client_id}:{self.client_secret}".encode()).decode()
         headers = {
@@ -94,25 +189,78 @@ class SpotifyPlaylistExtractor:
         data = {"grant_type": "client_credentials"}
         
         try:
-            response = requests.post(auth_url, headers=headers, data=data)
+            response = self.session.post(auth_url, headers=headers, data=data)
             response.raise_for_status()
-            self.token = response.json()["access_token"]
+            token_data = response.json()
+            self.token = token_data["access_token"]
+            
+            # Treat the token as expired a minute early so it doesn't run out mid-extraction
+            self.token_expiry = time.time() + token_data.get("expires_in", 3600) - 60
+            self.session.headers["Authorization"] = f"Bearer {self.token}"
+            if self.cache_token:
+                self.save_cached_token()
             return True, "Authentication successful"
         except requests.exceptions.RequestException as e:
             return False, f"Authentication error: {str(e)}"
     
+    def _get_with_retry(self, url, params):
+        """
+        GET a Spotify API URL, retrying when rate limited or on server errors
+        
+        Rate limited responses are retried after the Retry-After header's delay,
+        server errors after an exponential backoff of up to 30 seconds. Waiting stops
+        as soon as extraction is cancelled. If the access token is rejected, a new one
+        is requested once and the call retried.
+        
+        Returns:
+            requests.Response: The last response received
+        
+        Raises:
+            requests.exceptions.HTTPError: If Retry-After asks for a wait longer than _MAX_RETRY_DELAY
+        """
+        reauthenticated = False
+        for attempt in range(_MAX_RETRIES + 1):
+            token = self.token
+            response = self.session.get(url, params=params)
+            if attempt == _MAX_RETRIES or not self.is_extracting:
+                return response
+            
+            if response.status_code == 401 and not reauthenticated:
+                # The token expired or was revoked; concurrent pages share one new token
+                reauthenticated = True
+                with self.auth_lock:
+                    if self.token == token:
+                        self.authenticate(use_cache=False)
+                continue
+            elif response.status_code == 429:
+                try:
+                    delay = int(response.headers.get("Retry-After", 2 ** attempt))
+                except ValueError:
+                    delay = 2 ** attempt
+                if delay > _MAX_RETRY_DELAY:
+                    # Retrying early would only be rate limited again
+                    raise requests.exceptions.HTTPError(
+                        f"Rate limited by Spotify, retry after {delay} s", response=response
+                    )
+            elif response.status_code >= 500:
+                delay = min(2 ** attempt, 30)
+            else:
+                return response
+            
+            if self.cancel_event.wait(delay):
+                return response
+    
     def extract_playlist_id(self, playlist_url: str) -> Optional[str]:
         """
-        Extract playlist ID from Spotify URL
+        Extract playlist ID from Spotify URL or URI
         
         Args:
-            playlist_url (str): Spotify playlist URL
+            playlist_url (str): Spotify playlist URL or spotify:playlist: URI
         
         Returns:
             str or None: Extracted playlist ID
         """
-        pattern = r'spotify\.com/playlist/([a-zA-Z0-9]+)'
-        match = re.search(pattern, playlist_url)
+        match = _PLAYLIST_ID_RE.search(playlist_url)
         return match.group(1) if match else None
     
     def get_playlist_tracks(self, playlist_id: str, callback: Optional[Callable] = None):
@@ -121,45 +269,83 @@ class SpotifyPlaylistExtractor:
         
         Args:
             playlist_id (str): Spotify playlist ID
-            callback (callable, optional): Progress callback function
+            callback (callable, optional): Progress callback function, called as
+                callback(success, message) or, while fetching pages,
+                callback(success, message, (pages fetched, total pages))
         
         Returns:
-            List of track dictionaries
+            List of (track name, artists) tuples
         """
-        # Authenticate if no token
-        if not self.token:
+        # Authenticate if there's no token or it has expired
+        if not self.token or time.time() >= self.token_expiry:
             success, message = self.authenticate()
             if not success:
                 if callback:
                     callback(False, message)
                 return []
         
-        tracks = []
-        next_url = f"https://api.spotify.com/v1/playlists/{playlist_id}/tracks"
+        tracks_url = f"https://api.spotify.com/v1/playlists/{playlist_id}/tracks"
         
-        headers = {"Authorization": f"Bearer {self.token}"}
+        def fetch_page(offset):
+            """Fetch the tracks at offset, returning (tracks, total tracks in the playlist)"""
+            response = self._get_with_retry(
+                tracks_url,
+                {"offset": offset, "limit": _PAGE_SIZE, "fields": _TRACK_FIELDS}
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content) if orjson else response.json()
+            
+            page = []
+            join_artists = ", ".join
+            for item in data["items"]:
+                track = item.get("track")
+                if track:
+                    page.append((track["name"], join_artists([artist["name"] for artist in track["artists"]])))
+            return page, data["total"]
         
         try:
-            while next_url and self.is_extracting:
-                response = requests.get(next_url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                
-                for item in data["items"]:
-                    if item.get("track"):
-                        track_name = item["track"]["name"]
-                        artists = ", ".join([artist["name"] for artist in item["track"]["artists"]])
-                        tracks.append({"track": track_name, "artists": artists})
-                
-                # Update progress if callback provided
-                if callback:
-                    callback(True, f"Retrieved {len(tracks)} tracks so far...")
-                
-                # Get next page of results
-                next_url = data.get("next")
+            if not self.is_extracting:
+                return []
             
-            return tracks
-        except requests.exceptions.RequestException as e:
+            # The first page gives the playlist size; the remaining pages are then
+            # fetched concurrently and put back in playlist order
+            first_page, total = fetch_page(0)
+            pages = {0: first_page}
+            retrieved = len(first_page)
+            
+            offsets = range(_PAGE_SIZE, total, _PAGE_SIZE)
+            page_count = len(offsets) + 1
+            
+            # Update progress if callback provided
+            if callback:
+                callback(True, f"Retrieved {retrieved} tracks so far...", (1, page_count))
+            
+            with ThreadPoolExecutor(max_workers=_PAGE_WORKERS) as executor:
+                futures = {executor.submit(fetch_page, offset): offset for offset in offsets}
+                try:
+                    last_report = time.monotonic()
+                    for future in as_completed(futures):
+                        page, _ = future.result()
+                        pages[futures[future]] = page
+                        retrieved += len(page)
+                        
+                        # Report at most every _PROGRESS_INTERVAL, plus the last page,
+                        # so the GUI isn't sent an update per page
+                        now = time.monotonic()
+                        if callback and (now - last_report >= _PROGRESS_INTERVAL or len(pages) == page_count):
+                            last_report = now
+                            callback(True, f"Retrieved {retrieved} tracks so far...", (len(pages), page_count))
+                        
+                        if not self.is_extracting:
+                            break
+                finally:
+                    # Drop pages that haven't started after an error or cancellation
+                    for future in futures:
+                        future.cancel()
+            
+            return [track for offset in sorted(pages) for track in pages[offset]]
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # ValueError covers orjson.JSONDecodeError for responses that aren't JSON
             if callback:
                 callback(False, f"Error fetching tracks: {str(e)}")
             return []
@@ -169,16 +355,15 @@ class SpotifyPlaylistExtractor:
         Save tracks to file
         
         Args:
-            tracks (List[Dict]): List of tracks
+            tracks (List[Tuple[str, str]]): List of (track name, artists) tuples
             file_path (str): Path to save file
         
         Returns:
             Tuple of (success, message)
         """
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                for track in tracks:
-                    f.write(f"{track['track']} - {track['artists']}\n")
+            with open(file_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                f.writelines(f"{track_name} - {artists}\n" for track_name, artists in tracks)
             return True, f"Successfully saved {len(tracks)} tracks to {file_path}"
         except Exception as e:
             return False, f"Error saving file: {str(e)}"
@@ -196,6 +381,7 @@ class SpotifyPlaylistExtractor:
             Tuple of (success, message)
         """
         self.is_extracting = True
+        self.cancel_event.clear()
         
         # Extract playlist ID
         playlist_id = self.extract_playlist_id(playlist_url)
@@ -226,6 +412,7 @@ class SpotifyPlaylistExtractor:
         Cancel ongoing extraction
         """
         self.is_extracting = False
+        self.cancel_event.set()
 
 
 class SpotifyExtractorGUI:
@@ -352,7 +539,7 @@ class SpotifyExtractorGUI:
         )
         status_label.pack(fill=tk.X, pady=(10, 0))
         
-        self.progress = ttk.Progressbar(main_frame, mode="indeterminate")
+        self.progress = ttk.Progressbar(main_frame, mode="determinate", maximum=100)
         self.progress.pack(fill=tk.X, pady=(10, 0))
     
     def browse_file(self):
@@ -391,35 +578,37 @@ class SpotifyExtractorGUI:
             messagebox.showerror("Error", "Please enter your Spotify API credentials")
             return
         
-        # Update extractor credentials
+        # Update extractor credentials; the access token is only cached if they are remembered
         self.extractor.client_id = client_id
         self.extractor.client_secret = client_secret
-        
-        # Save credentials if requested
-        if remember_credentials:
-            self.extractor.save_credentials()
+        self.extractor.cache_token = remember_credentials
         
         # Update UI
         self.extract_button.config(state=tk.DISABLED)
         self.cancel_button.config(state=tk.NORMAL)
-        self.progress.start()
+        self.progress["value"] = 0
         self.status_var.set("Starting extraction...")
         
-        # Start extraction in a separate thread
+        # Start extraction in a separate thread (which also saves the credentials if requested)
         threading.Thread(
             target=self.run_extraction, 
-            args=(playlist_url, output_file), 
+            args=(playlist_url, output_file, remember_credentials), 
             daemon=True
         ).start()
     
-    def run_extraction(self, playlist_url, output_file):
+    def run_extraction(self, playlist_url, output_file, remember_credentials=False):
         """
         Run extraction process in a separate thread
         
         Args:
             playlist_url (str): Spotify playlist URL
             output_file (str): Path to save output file
+            remember_credentials (bool): Save the credentials to the config file first
         """
+        # Save credentials if requested, off the UI thread
+        if remember_credentials:
+            self.extractor.save_credentials()
+        
         success, message = self.extractor.extract_playlist(
             playlist_url, 
             output_file,
@@ -429,15 +618,29 @@ class SpotifyExtractorGUI:
         # Update UI when finished
         self.root.after(0, self.extraction_finished, success, message)
     
-    def update_status(self, success, message):
+    def update_status(self, success, message, progress=None):
         """
         Update status from extraction thread
         
         Args:
             success (bool): Whether the operation was successful
             message (str): Status message
+            progress (tuple, optional): (pages fetched, total pages)
+        """
+        self.root.after(0, self.show_status, message, progress)
+    
+    def show_status(self, message, progress=None):
+        """
+        Show a status message and progress on the UI thread
+        
+        Args:
+            message (str): Status message
+            progress (tuple, optional): (pages fetched, total pages)
         """
-        self.root.after(0, lambda: self.status_var.set(message))
+        self.status_var.set(message)
+        if progress:
+            current, total = progress
+            self.progress["value"] = 100 * current / total
     
     def extraction_finished(self, success, message):
         """
@@ -447,7 +650,6 @@ class SpotifyExtractorGUI:
             success (bool): Whether the extraction was successful
             message (str): Result message
         """
-        self.progress.stop()
         self.extract_button.config(state=tk.NORMAL)
         self.cancel_button.config(state=tk.DISABLED)
         self.status_var.set(message)